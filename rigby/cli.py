@@ -1,16 +1,53 @@
 """Command line interface for rigby."""
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 import click
-from rich.console import Console
-from rich.panel import Panel
 from .core import clean_file, clean_source
 from .config import RigbyConfig
-from .display import show_cleaning_complete
 
-console = Console()
+def _walk_py(root: Union[str, Path], exclude_patterns: List[str]):
+    """Yield paths to .py files under root, pruning excluded directories.
+
+    Unreadable directories are skipped, matching rglob's tolerance.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if any(fnmatch(entry.name + '/', pattern) for pattern in exclude_patterns):
+                continue
+            yield from _walk_py(entry.path, exclude_patterns)
+        elif entry.name.endswith('.py'):
+            yield Path(entry.path)
+
+def _process_one(file: Path, config: RigbyConfig, check: bool,
+                 diff: bool) -> Tuple[Path, bool, Optional[bytes], Optional[List[str]], Optional[str]]:
+    """Clean a single file, returning (file, modified, cleaned, diff_chunks, error)."""
+    try:
+        original = file.read_bytes().decode('utf-8')
+        cleaned = clean_source(original, config)
+        if original == cleaned:
+            return file, False, None, None, None
+        diff_chunks = None
+        if diff:
+            from difflib import unified_diff
+            diff_chunks = list(unified_diff(
+                original.splitlines(keepends=True),
+                cleaned.splitlines(keepends=True),
+                fromfile=str(file),
+                tofile=str(file)
+            ))
+        payload = None if check else cleaned.encode('utf-8')
+        return file, True, payload, diff_chunks, None
+    except Exception as e:
+        return file, False, None, None, str(e)
 
 @click.group()
 @click.version_option()
@@ -33,43 +70,57 @@ def cli():
 def run(paths: List[str], config: Optional[str], check: bool,
         diff: bool, verbose: bool, quiet: bool):
     """Clean Python files by managing empty lines."""
+    from rich.console import Console
+    console = Console()
     if not paths:
         console.print("[yellow]No paths provided. Using current directory.[/]")
         paths = ["."]
     config_obj = RigbyConfig.from_file(Path(config) if config else None)
-    modified_files = []
-    error_files = []
+    py_files = []
     for path in paths:
         path = Path(path)
         if path.is_dir():
-            python_files = path.rglob("*.py")
+            py_files.extend(_walk_py(path, config_obj.exclude_patterns))
         else:
-            python_files = [path]
-        for file in python_files:
-            try:
-                if verbose and not quiet:
-                    console.print(f"Processing {file}...")
-                with open(file, 'r', encoding='utf-8') as f:
-                    original = f.read()
-                cleaned = clean_source(original, config_obj)
-                if original != cleaned:
-                    modified_files.append(str(file))
-                    if diff and not quiet:
-                        from difflib import unified_diff
-                        diff_lines = unified_diff(
-                            original.splitlines(keepends=True),
-                            cleaned.splitlines(keepends=True),
-                            fromfile=str(file),
-                            tofile=str(file)
-                        )
-                        console.print(''.join(diff_lines))
-                    if not check:
-                        with open(file, 'w', encoding='utf-8') as f:
-                            f.write(cleaned)
-            except Exception as e:
-                error_files.append((file, str(e)))
+            py_files.append(path)
+    exclude_regexes = config_obj.compiled_exclude_patterns()
+    py_files = [file for file in py_files
+                if not any(regex.match(str(file)) for regex in exclude_regexes)]
+    modified_files = []
+    error_files = []
+    write_futures = {}
+    verbose_buf: List[str] = []
+    with ProcessPoolExecutor() as executor, \
+            ThreadPoolExecutor(max_workers=1) as writer:
+        futures = {executor.submit(_process_one, file, config_obj, check, diff): file
+                   for file in py_files}
+        for future in as_completed(futures):
+            file, modified, cleaned, diff_chunks, error = future.result()
+            if verbose and not quiet:
+                verbose_buf.append(f"Processing {file}...")
+                if len(verbose_buf) >= 256:
+                    console.print('\n'.join(verbose_buf))
+                    verbose_buf.clear()
+            if error is not None:
+                error_files.append((file, error))
                 if not quiet:
-                    console.print(f"[red]Error processing {file}: {e}[/]")
+                    console.print(f"[red]Error processing {file}: {error}[/]")
+                continue
+            if modified:
+                modified_files.append(str(file))
+                if diff_chunks is not None and not quiet:
+                    console.file.writelines(diff_chunks)
+                    console.file.write('\n')
+                if cleaned is not None:
+                    write_futures[writer.submit(file.write_bytes, cleaned)] = file
+    if verbose_buf:
+        console.print('\n'.join(verbose_buf))
+    for write_future, file in write_futures.items():
+        exc = write_future.exception()
+        if exc is not None:
+            error_files.append((file, str(exc)))
+            if not quiet:
+                console.print(f"[red]Error writing {file}: {exc}[/]")
     if not quiet:
         if modified_files:
             if check:
@@ -78,6 +129,7 @@ def run(paths: List[str], config: Optional[str], check: bool,
                     for file in modified_files:
                         console.print(f"  {file}")
             else:
+                from .display import show_cleaning_complete
                 show_cleaning_complete(modified_files)
         if error_files:
             console.print(f"\n[red]{len(error_files)} files had errors[/]")
@@ -92,6 +144,9 @@ def run(paths: List[str], config: Optional[str], check: bool,
 @cli.command()
 def init():
     """Create a default configuration file."""
+    from rich.console import Console
+    from rich.panel import Panel
+    console = Console()
     config_file = Path(".rigby.toml")
     if config_file.exists():
         console.print("[red]Configuration file already exists![/]")
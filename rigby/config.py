@@ -1,36 +1,83 @@
 """Configuration handling for rigby."""
 
+import re
+from dataclasses import dataclass, field, fields
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-import tomli
-from pydantic import BaseModel, Field
+from typing import List, Optional, Tuple
 
-class ImportGroup(BaseModel):
+_CACHE_DIR = Path.home() / ".cache" / "rigby"
+
+def _config_cache_path(config_path: Path) -> Path:
+    """Return the cache file path for a config file, keyed by its path."""
+    import hashlib
+    key = hashlib.blake2b(str(config_path.resolve()).encode()).hexdigest()
+    return _CACHE_DIR / f"config.{key}.pkl"
+
+def _load_cached_config(config_path: Path):
+    """Load a previously parsed config from the cache, or None on any miss."""
+    import pickle
+    try:
+        with open(_config_cache_path(config_path), "rb") as f:
+            mtime_ns, config = pickle.load(f)
+        if mtime_ns != config_path.stat().st_mtime_ns:
+            return None
+        return config
+    except Exception:
+        return None
+
+def _store_cached_config(config_path: Path, config: "RigbyConfig") -> None:
+    """Best-effort write of a parsed config to the cache."""
+    import pickle
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_config_cache_path(config_path), "wb") as f:
+            pickle.dump((config_path.stat().st_mtime_ns, config), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass
+
+@lru_cache(maxsize=None)
+def compile_patterns(patterns: Tuple[str, ...]) -> List[re.Pattern]:
+    """Compile glob patterns into regexes once per unique pattern tuple."""
+    return [re.compile(translate(pattern)) for pattern in patterns]
+
+@dataclass(frozen=True)
+class ImportGroup:
     """Configuration for import groups."""
-    name: str = Field(description="Name of the import group")
-    patterns: List[str] = Field(description="Patterns to match imports for this group")
+    name: str
+    patterns: List[str]
+
+def _default_import_groups() -> List[ImportGroup]:
+    return [
+        ImportGroup(name="future", patterns=["__future__"]),
+        ImportGroup(name="standard_library", patterns=["typing", "pathlib", "os", "sys", "*"]),
+        ImportGroup(name="third_party", patterns=["click.*", "rich.*", "pydantic.*", "loguru.*"]),
+        ImportGroup(name="local", patterns=["rigby.*"]),
+    ]
 
-class RigbyConfig(BaseModel):
+@dataclass(frozen=True)
+class RigbyConfig:
     """Configuration settings for rigby."""
-    lines_between_functions: int = Field(default=1, description="Number of empty lines between functions")
-    lines_between_classes: int = Field(default=2, description="Number of empty lines between classes")
-    preserve_docstring_spacing: bool = Field(default=True, description="Whether to preserve empty lines in docstrings")
-    exclude_patterns: List[str] = Field(
-        default=["venv/*", ".git/*", "__pycache__/*"],
-        description="Glob patterns for files to exclude"
-    )
-    sort_methods: bool = Field(default=False, description="Whether to sort class methods alphabetically")
-    sort_imports: bool = Field(default=True, description="Whether to sort and group imports")
-    import_groups: List[ImportGroup] = Field(
-        default=[
-            ImportGroup(name="future", patterns=["__future__"]),
-            ImportGroup(name="standard_library", patterns=["typing", "pathlib", "os", "sys", "*"]),
-            ImportGroup(name="third_party", patterns=["click.*", "rich.*", "pydantic.*", "loguru.*"]),
-            ImportGroup(name="local", patterns=["rigby.*"]),
-        ],
-        description="Groups for organizing imports"
-    )
-    lines_between_import_groups: int = Field(default=1, description="Number of empty lines between import groups")
+    lines_between_functions: int = 1
+    lines_between_classes: int = 2
+    preserve_docstring_spacing: bool = True
+    exclude_patterns: List[str] = field(
+        default_factory=lambda: ["venv/*", ".git/*", "__pycache__/*"])
+    sort_methods: bool = False
+    sort_imports: bool = True
+    import_groups: List[ImportGroup] = field(default_factory=_default_import_groups)
+    lines_between_import_groups: int = 1
+
+    def compiled_exclude_patterns(self) -> List[re.Pattern]:
+        """Return precompiled regexes for the exclude patterns."""
+        return compile_patterns(tuple(self.exclude_patterns))
+
+    def compiled_import_groups(self) -> List[Tuple[str, List[re.Pattern]]]:
+        """Return (group name, precompiled regexes) pairs for the import groups."""
+        return [(group.name, compile_patterns(tuple(group.patterns)))
+                for group in self.import_groups]
 
     @classmethod
     def from_file(cls, config_path: Optional[Path] = None) -> "RigbyConfig":
@@ -46,13 +93,26 @@ class RigbyConfig(BaseModel):
                     config_path = loc
                     break
         if config_path and config_path.exists():
+            cached = _load_cached_config(config_path)
+            if isinstance(cached, cls):
+                return cached
+            import tomli
             with open(config_path, "rb") as f:
                 try:
                     if config_path.name == "pyproject.toml":
                         data = tomli.load(f).get("tool", {}).get("rigby", {})
                     else:
                         data = tomli.load(f)
-                    return cls(**data)
+                    known = {f.name for f in fields(cls)}
+                    data = {k: v for k, v in data.items() if k in known}
+                    if "import_groups" in data:
+                        data["import_groups"] = [
+                            group if isinstance(group, ImportGroup) else ImportGroup(**group)
+                            for group in data["import_groups"]
+                        ]
+                    config = cls(**data)
+                    _store_cached_config(config_path, config)
+                    return config
                 except Exception as e:
                     from loguru import logger
                     logger.warning(f"Error loading config from {config_path}: {e}")
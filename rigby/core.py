@@ -1,69 +1,82 @@
 """Core functionality for rigby package."""
 
-from loguru import logger
 import ast
+from itertools import compress
 from pathlib import Path
 from typing import Union, List, Tuple
 
 from .config import RigbyConfig
-from .imports import sort_and_format_imports
+from .imports import _split_lines, sort_and_format_imports
 
 def clean_source(source: str, config: RigbyConfig = None) -> str:
     """Clean source code by managing empty lines according to configuration."""
     if config is None:
         config = RigbyConfig()
-    source = sort_and_format_imports(source, config)
-        
+    if (not config.sort_imports and '\r' not in source
+            and '\n\n\n' not in source
+            and 'def ' not in source and 'class ' not in source):
+        if all(line and not line.isspace() for line in source.splitlines()):
+            return source[:-1] if source.endswith('\n') else source
+    if '\r' in source:
+        source = source.replace('\r\n', '\n').replace('\r', '\n')
     tree = ast.parse(source)
-    lines = source.splitlines()
-    to_remove = set()
+    lines = _split_lines(source)
+    new_source, tree = sort_and_format_imports(source, config, tree, lines)
+    if tree is None:
+        source = new_source
+        tree = ast.parse(source)
+        lines = _split_lines(source)
+    blanks = {i for i, line in enumerate(lines) if not line or line.isspace()}
+    to_remove = bytearray(len(lines))
     class_ends = set()
     function_ends = set()
     nodes: List[Tuple[int, ast.AST]] = []
-    
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+
+    def visit(body: List[ast.stmt]) -> None:
+        for node in body:
+            if not isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                continue
             start_line = node.lineno - 1
             last_node = node.body[-1]
             end_line = (last_node.end_lineno if hasattr(last_node, 'end_lineno') else last_node.lineno) - 1
             nodes.append((start_line, node))
-            for i in range(start_line, end_line + 1):
-                if i >= len(lines):
+            doc_range = None
+            if (config.preserve_docstring_spacing and node.body
+                    and isinstance(node.body[0], ast.Expr)
+                    and isinstance(node.body[0].value, ast.Constant)
+                    and isinstance(node.body[0].value.value, str)):
+                doc_range = (node.lineno - 1, node.body[0].end_lineno - 1)
+            for i in blanks.intersection(range(start_line, end_line + 1)):
+                if doc_range and doc_range[0] <= i <= doc_range[1]:
                     continue
-                if not lines[i].strip():
-                    if config.preserve_docstring_spacing and is_in_docstring(node, i):
-                        continue
-                    to_remove.add(i)
+                to_remove[i] = 1
             if isinstance(node, ast.ClassDef):
                 class_ends.add(end_line)
             else:
                 function_ends.add(end_line)
-    
+            visit(node.body)
+
+    visit(tree.body)
+
     if config.sort_methods:
         nodes.sort(key=lambda x: (x[0], x[1].__class__.__name__, x[1].name))
     
+    boundaries = sorted(class_ends | function_ends)
     cleaned_lines = []
-    i = 0
-    while i < len(lines):
-        if i not in to_remove:
-            cleaned_lines.append(lines[i])
-            if i in class_ends:
-                cleaned_lines.extend([''] * config.lines_between_classes)
-            elif i in function_ends:
-                cleaned_lines.extend([''] * config.lines_between_functions)
-        i += 1
-    
+    prev = 0
+    for boundary in boundaries:
+        stop = boundary + 1
+        cleaned_lines.extend(compress(lines[prev:stop],
+                                      (not flag for flag in to_remove[prev:stop])))
+        if not to_remove[boundary]:
+            spacing = (config.lines_between_classes if boundary in class_ends
+                       else config.lines_between_functions)
+            cleaned_lines.extend([''] * spacing)
+        prev = stop
+    cleaned_lines.extend(compress(lines[prev:],
+                                  (not flag for flag in to_remove[prev:])))
     return '\n'.join(cleaned_lines)
 
-def is_in_docstring(node: ast.AST, line_no: int) -> bool:
-    """Check if a line number falls within a node's docstring."""
-    if not ast.get_docstring(node):
-        return False
-    docstring_node = node.body[0] if isinstance(node.body[0], ast.Expr) else None
-    if not docstring_node or not isinstance(docstring_node.value, ast.Str):
-        return False
-    return node.lineno <= line_no <= docstring_node.end_lineno
-
 def clean_file(file_path: Union[str, Path], config: RigbyConfig = None) -> None:
     """Clean a Python file according to configuration."""
     if config is None:
@@ -71,12 +84,10 @@ def clean_file(file_path: Union[str, Path], config: RigbyConfig = None) -> None:
     file_path = Path(file_path)
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
-    from fnmatch import fnmatch
-    if any(fnmatch(str(file_path), pattern) for pattern in config.exclude_patterns):
+    if any(regex.match(str(file_path)) for regex in config.compiled_exclude_patterns()):
+        from loguru import logger
         logger.debug(f"Skipping excluded file: {file_path}")
         return
-    with open(file_path, 'r', encoding='utf-8') as f:
-        source = f.read()
+    source = file_path.read_bytes().decode('utf-8')
     cleaned_source = clean_source(source, config)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(cleaned_source)
\ No newline at end of file
+    file_path.write_bytes(cleaned_source.encode('utf-8'))
\ No newline at end of file
@@ -1,7 +1,4 @@
 """Display components for rigby package."""
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 from typing import List
 
 DRAGON_ASCII = """
@@ -25,10 +22,12 @@ SIGN_OFF = (
     "[dim]–[/] [link=https://github.com/lothartj]github.com/lothartj[/]"
 )
 
-console = Console()
-
 def show_installation_complete():
     """Show a colorful installation complete message."""
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.text import Text
+    console = Console()
     console.print()
     console.print(Panel(
         Text(DRAGON_ASCII, style="bold magenta"),
@@ -40,6 +39,9 @@ def show_installation_complete():
 
 def show_cleaning_complete(cleaned_files: List[str]):
     """Show a colorful completion message with cleaned files."""
+    from rich.console import Console
+    from rich.panel import Panel
+    console = Console()
     console.print()
     files_text = "\n".join([f"[green]✓[/] [cyan]{file}[/]" for file in cleaned_files])
     console.print(Panel(
@@ -2,11 +2,17 @@
 
 import ast
 from dataclasses import dataclass
-from fnmatch import fnmatch
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Tuple
 
 from .config import RigbyConfig, ImportGroup
 
+def _split_lines(source: str) -> List[str]:
+    """Split source into lines on '\\n'; callers normalize CR/CRLF endings first."""
+    lines = source.split('\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    return lines
+
 @dataclass
 class Import:
     """Represents a single import statement."""
@@ -17,85 +23,109 @@ class Import:
     col_offset: int
     end_lineno: int
     end_col_offset: int
+    names_str: str = ""
 
 def get_imports(tree: ast.AST) -> List[Import]:
-    """Extract all imports from an AST."""
+    """Extract imports from the module top level, descending only into If/Try blocks."""
     imports = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for name in node.names:
+
+    def visit(body: List[ast.stmt]) -> None:
+        for node in body:
+            if isinstance(node, ast.Import):
+                for name in node.names:
+                    imports.append(Import(
+                        module=name.name,
+                        names=[],
+                        is_from=False,
+                        lineno=node.lineno,
+                        col_offset=node.col_offset,
+                        end_lineno=node.end_lineno or node.lineno,
+                        end_col_offset=node.end_col_offset or 0
+                    ))
+            elif isinstance(node, ast.ImportFrom):
+                names = sorted(n.name for n in node.names)
                 imports.append(Import(
-                    module=name.name,
-                    names=[],
-                    is_from=False,
+                    module=node.module or "",
+                    names=names,
+                    is_from=True,
                     lineno=node.lineno,
                     col_offset=node.col_offset,
                     end_lineno=node.end_lineno or node.lineno,
-                    end_col_offset=node.end_col_offset or 0
+                    end_col_offset=node.end_col_offset or 0,
+                    names_str=", ".join(names)
                 ))
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            imports.append(Import(
-                module=module,
-                names=[n.name for n in node.names],
-                is_from=True,
-                lineno=node.lineno,
-                col_offset=node.col_offset,
-                end_lineno=node.end_lineno or node.lineno,
-                end_col_offset=node.end_col_offset or 0
-            ))
+            elif isinstance(node, ast.If):
+                visit(node.body)
+                visit(node.orelse)
+            elif isinstance(node, ast.Try):
+                visit(node.body)
+                for handler in node.handlers:
+                    visit(handler.body)
+                visit(node.orelse)
+                visit(node.finalbody)
+
+    visit(tree.body)
     return imports
 
 def group_imports(imports: List[Import], config: RigbyConfig) -> Dict[str, List[Import]]:
     """Group imports according to configuration."""
     groups: Dict[str, List[Import]] = {group.name: [] for group in config.import_groups}
-    
+    compiled_groups = config.compiled_import_groups()
+
     for imp in imports:
         module = imp.module
         assigned = False
-        for group in config.import_groups:
-            if any(fnmatch(module, pattern) for pattern in group.patterns):
-                groups[group.name].append(imp)
+        for group_name, compiled in compiled_groups:
+            if any(regex.match(module) for regex in compiled):
+                groups[group_name].append(imp)
                 assigned = True
                 break
         if not assigned:
             groups["standard_library"].append(imp)
     
     for group in groups.values():
-        group.sort(key=lambda x: (x.module, x.names))
+        group.sort(key=lambda x: (x.module, x.names_str))
     
     return groups
 
 def format_import(imp: Import) -> str:
     """Format an import statement."""
     if imp.is_from:
-        names = ", ".join(sorted(imp.names))
-        return f"from {imp.module} import {names}"
+        return f"from {imp.module} import {imp.names_str}"
     return f"import {imp.module}"
 
-def sort_and_format_imports(source: str, config: RigbyConfig) -> str:
-    """Sort and format imports in the source code."""
+def sort_and_format_imports(source: str, config: RigbyConfig,
+                            tree: Optional[ast.AST] = None,
+                            lines: Optional[List[str]] = None) -> Tuple[str, Optional[ast.AST]]:
+    """Sort and format imports, returning (source, tree).
+
+    The returned tree is the still-valid AST for the returned source, or
+    None when the imports were rewritten and the source must be re-parsed.
+    An already-split line list may be passed to avoid re-splitting.
+    """
     if not config.sort_imports:
-        return source
-    
-    tree = ast.parse(source)
+        return source, tree
+
+    if tree is None:
+        tree = ast.parse(source)
     imports = get_imports(tree)
     if not imports:
-        return source
-        
+        return source, tree
+
     import_lines = set()
     for imp in imports:
         for i in range(imp.lineno - 1, imp.end_lineno):
             import_lines.add(i)
     grouped_imports = group_imports(imports, config)
     new_imports = []
-    for group_name, group_imports in grouped_imports.items():
-        if group_imports:
-            new_imports.extend(format_import(imp) for imp in group_imports)
+    for group_name, group_members in grouped_imports.items():
+        if group_members:
+            new_imports.extend(format_import(imp) for imp in group_members)
             new_imports.append("")
     if new_imports and not new_imports[-1]:
         new_imports.pop()
-    lines = source.splitlines()
+    if lines is None:
+        lines = _split_lines(source)
     min_line = min(import_lines)
     max_line = max(import_lines)
     
@@ -104,5 +134,5 @@ def sort_and_format_imports(source: str, config: RigbyConfig) -> str:
         new_imports +
         lines[max_line + 1:]
     )
-    
-    return "\n".join(result) 
\ No newline at end of file
+
+    return "\n".join(result), None 
\ No newline at end of file